@@ -0,0 +1,23 @@
+# Generated by Django 3.2.12 on 2026-09-01 13:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='report',
+            name='upload_srv_kafka_msg',
+            field=models.JSONField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='reportarchive',
+            name='upload_srv_kafka_msg',
+            field=models.JSONField(null=True),
+        ),
+    ]
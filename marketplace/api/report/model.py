@@ -21,7 +21,7 @@ class AbstractReport(models.Model):
     account = models.CharField(max_length=50, null=True)
     request_id = models.CharField(max_length=50, null=True)
     upload_ack_status = models.CharField(max_length=10, null=True)
-    upload_srv_kafka_msg = models.TextField(null=True)
+    upload_srv_kafka_msg = models.JSONField(null=True)
     git_commit = models.CharField(max_length=50, null=True)
     ready_to_archive = models.BooleanField(null=False, default=False)
 
@@ -24,3 +24,9 @@ SECRET_KEY = ENVIRONMENT.get_value("DJANGO_SECRET_KEY", default="test")
 TEST_RUNNER = "django.test.runner.DiscoverRunner"
 
 LOGGING["handlers"]["console"]["level"] = "ERROR"
+
+# the clowder config can supply postgres-only ssl options; the sqlite
+# engine used for tests rejects them at connect time, and the sqlite
+# test database Django creates is already shared in memory
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":  # noqa: F405
+    DATABASES["default"].pop("OPTIONS", None)  # noqa: F405
@@ -51,6 +51,8 @@ NEW_REPORT_QUERY_INTERVAL = int(NEW_REPORT_QUERY_INTERVAL)
 RETRY = Enum("RETRY", "clear increment keep_same")
 RETRIES_ALLOWED = int(RETRIES_ALLOWED)
 RETRY_TIME = int(RETRY_TIME)
+# keys every report slice json must carry a non-empty value for
+REQUIRED_REPORT_KEYS = frozenset({"report_slice_id"})
 
 # setup for prometheus metrics
 QUEUED_REPORTS = Gauge("queued_reports", "Reports waiting to be processed")
@@ -649,13 +651,9 @@ class AbstractProcessor(ABC):  # pylint: disable=too-many-instance-attributes
         :returns: tuple contain list of valid and invalid hosts
         """
         self.prefix = "VALIDATE REPORT STRUCTURE"
-        required_keys = ["report_slice_id"]
-
-        missing_keys = []
-        for key in required_keys:
-            required_key = self.report_json.get(key)
-            if not required_key:
-                missing_keys.append(key)
+        # the falsy check also rejects keys present with empty values,
+        # so a plain key-set difference is not enough here
+        missing_keys = [key for key in REQUIRED_REPORT_KEYS if not self.report_json.get(key)]
 
         if missing_keys:
             missing_keys_str = ", ".join(missing_keys)
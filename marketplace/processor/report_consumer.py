@@ -136,72 +136,113 @@ class ReportConsumer:
             return
 
     async def save_message_and_ack(self, consumer_record):
-        """Save and ack the uploaded kafka message."""
+        """Save and ack a single uploaded kafka message."""
+        await self.save_messages_and_ack([consumer_record])
+
+    def _build_report(self, consumer_record):
+        """Validate an uploaded kafka message and build its report.
+
+        :param consumer_record: the raw kafka message
+        :returns Report: an unsaved report for the message
+        :raises MKTKafkaMsgException: if required fields are missing
+        """
+        missing_fields = []
+        self.upload_message = self.unpack_consumer_record(consumer_record)
+        # rh_account is being deprecated so we use it as a backup if
+        # account is not there
+        rh_account = self.upload_message.get("rh_account")
+        request_id = self.upload_message.get("request_id")
+        self.account_number = self.upload_message.get("account", rh_account)
+        if not self.account_number:
+            missing_fields.append("account")
+        if not request_id:
+            missing_fields.append("request_id")
+        if missing_fields:
+            raise MKTKafkaMsgException(
+                format_message(self.prefix, "Message missing required field(s): %s." % ", ".join(missing_fields))
+            )
+        uploaded_report = {
+            "upload_srv_kafka_msg": self.upload_message,
+            "account": self.account_number,
+            "request_id": request_id,
+            "state": Report.NEW,
+            "state_info": json.dumps([Report.NEW]),
+            "last_update_time": datetime.now(pytz.utc),
+            "arrival_time": datetime.now(pytz.utc),
+            "retry_count": 0,
+        }
+        report_serializer = ReportSerializer(data=uploaded_report)
+        report_serializer.is_valid(raise_exception=True)
+        return Report(**report_serializer.validated_data)
+
+    async def save_messages_and_ack(self, consumer_records):
+        """Save and ack a batch of uploaded kafka messages.
+
+        The reports for all of the valid messages in the batch are built
+        in memory and inserted with a single bulk_create round trip
+        before the offsets are committed.
+        """
         self.prefix = "SAVING MESSAGE"
-        if consumer_record.topic() == MKT_TOPIC:
+        reports_to_save = []
+        discarded_records = False
+        for consumer_record in consumer_records:
+            if consumer_record.topic() != MKT_TOPIC:
+                LOG.debug(format_message(self.prefix, f"Message not on {MKT_TOPIC} topic: {consumer_record}"))
+                continue
             try:
-                missing_fields = []
-                self.upload_message = self.unpack_consumer_record(consumer_record)
-                # rh_account is being deprecated so we use it as a backup if
-                # account is not there
-                rh_account = self.upload_message.get("rh_account")
-                request_id = self.upload_message.get("request_id")
-                self.account_number = self.upload_message.get("account", rh_account)
-                if not self.account_number:
-                    missing_fields.append("account")
-                if not request_id:
-                    missing_fields.append("request_id")
-                if missing_fields:
-                    raise MKTKafkaMsgException(
-                        format_message(
-                            self.prefix, "Message missing required field(s): %s." % ", ".join(missing_fields)
-                        )
-                    )
-                try:
-                    uploaded_report = {
-                        "upload_srv_kafka_msg": json.dumps(self.upload_message),
-                        "account": self.account_number,
-                        "request_id": request_id,
-                        "state": Report.NEW,
-                        "state_info": json.dumps([Report.NEW]),
-                        "last_update_time": datetime.now(pytz.utc),
-                        "arrival_time": datetime.now(pytz.utc),
-                        "retry_count": 0,
-                    }
-                    report_serializer = ReportSerializer(data=uploaded_report)
-                    report_serializer.is_valid(raise_exception=True)
-                    async_save = sync_to_async(report_serializer.save)
-                    await async_save()
-                    MSG_UPLOADS.labels(account_number=self.account_number).inc()
-                    LOG.info(format_message(self.prefix, "Upload service message saved. Ready for processing."))
-                    self.consumer.commit()
-                except KafkaError as kerror:
-                    KAFKA_ERRORS.inc()
-                    LOG.error(
-                        format_message(
-                            self.prefix,
-                            "The following error occurred while trying to save and " "commit the message: %s" % kerror,
-                        )
-                    )
-                    stop_all_event_loops()
-                except Exception as error:  # pylint: disable=broad-except
-                    DB_ERRORS.inc()
-                    LOG.error(
-                        format_message(
-                            self.prefix,
-                            "The following error occurred while trying to save and " "commit the message: %s" % error,
-                        )
-                    )
-                    stop_all_event_loops()
+                reports_to_save.append(self._build_report(consumer_record))
             except MKTKafkaMsgException as message_error:
                 LOG.error(
                     format_message(
                         self.prefix, f"Error processing records.  Message: {consumer_record}, Error: {message_error}"
                     )
                 )
+                # the discarded record still needs its offset committed,
+                # but not before the valid records in the batch are saved
+                discarded_records = True
+            except Exception as error:  # pylint: disable=broad-except
+                DB_ERRORS.inc()
+                LOG.error(
+                    format_message(
+                        self.prefix,
+                        "The following error occurred while trying to save and " "commit the message: %s" % error,
+                    )
+                )
+                stop_all_event_loops()
+                return
+        if not reports_to_save:
+            if discarded_records:
                 self.consumer.commit()
-        else:
-            LOG.debug(format_message(self.prefix, f"Message not on {MKT_TOPIC} topic: {consumer_record}"))
+            return
+        await self._bulk_save_and_commit(reports_to_save)
+
+    async def _bulk_save_and_commit(self, reports_to_save):
+        """Insert a batch of reports and then commit the offsets."""
+        try:
+            async_bulk_create = sync_to_async(Report.objects.bulk_create)
+            await async_bulk_create(reports_to_save, batch_size=1000)
+            for report in reports_to_save:
+                MSG_UPLOADS.labels(account_number=report.account).inc()
+            LOG.info(format_message(self.prefix, "Upload service message saved. Ready for processing."))
+            self.consumer.commit()
+        except KafkaError as kerror:
+            KAFKA_ERRORS.inc()
+            LOG.error(
+                format_message(
+                    self.prefix,
+                    "The following error occurred while trying to save and " "commit the message: %s" % kerror,
+                )
+            )
+            stop_all_event_loops()
+        except Exception as error:  # pylint: disable=broad-except
+            DB_ERRORS.inc()
+            LOG.error(
+                format_message(
+                    self.prefix,
+                    "The following error occurred while trying to save and " "commit the message: %s" % error,
+                )
+            )
+            stop_all_event_loops()
 
     def unpack_consumer_record(self, consumer_record):
         """Decode the uploaded message and return it in JSON format."""
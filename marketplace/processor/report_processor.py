@@ -16,17 +16,19 @@
 #
 """Report Processor."""
 import asyncio
-import json
+import gzip
 import logging
 import tarfile
 import threading
+import zlib
 from datetime import datetime
 from http import HTTPStatus
 from io import BytesIO
 from threading import Thread
 
+import httpx
+import orjson
 import pytz
-import requests
 from asgiref.sync import sync_to_async
 from confluent_kafka import KafkaException
 from confluent_kafka import Producer
@@ -163,6 +165,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         state_metrics = {Report.FAILED_DOWNLOAD: FAILED_TO_DOWNLOAD, Report.FAILED_VALIDATION: FAILED_TO_VALIDATE}
         self.async_states = [Report.STARTED, Report.VALIDATED]
         self.producer = None
+        self._http = None
         super().__init__(
             pre_delegate=self.pre_delegate,
             state_functions=state_functions,
@@ -180,7 +183,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         """
         self.state = self.report_or_slice.state
         self.account_number = self.report_or_slice.account
-        self.upload_message = json.loads(self.report_or_slice.upload_srv_kafka_msg)
+        self.upload_message = self.report_or_slice.upload_srv_kafka_msg
         if self.report_or_slice.report_platform_id:
             self.report_platform_id = self.report_or_slice.report_platform_id
         if self.report_or_slice.upload_ack_status:
@@ -240,7 +243,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         self.status = SUCCESS_CONFIRM_STATUS
         for report_slice in report_slices:
             try:
-                self.report_json = json.loads(report_slice.report_json)
+                self.report_json = orjson.loads(report_slice.report_json)
                 self._validate_report_details()
                 # Here we want to update the report state of the actual report slice
                 options = {"state": ReportSlice.NEW}
@@ -357,15 +360,15 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         report_slice = {
             "state": ReportSlice.PENDING,
             "account": self.account_number,
-            "state_info": json.dumps([ReportSlice.PENDING]),
+            "state_info": orjson.dumps([ReportSlice.PENDING]).decode(),
             "last_update_time": datetime.now(pytz.utc),
             "retry_count": 0,
-            "report_json": json.dumps(report_json),
+            "report_json": orjson.dumps(report_json).decode(),
             "report_platform_id": self.report_platform_id,
             "report_slice_id": report_slice_id,
             "report": self.report_or_slice.id,
             "source": source,
-            "source_metadata": json.dumps(source_metadata),
+            "source_metadata": orjson.dumps(source_metadata).decode(),
             "creation_time": datetime.now(pytz.utc),
         }
         slice_serializer = ReportSliceSerializer(data=report_slice)
@@ -402,9 +405,6 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
             retry = options.get("retry", RETRY.clear)
             ready_to_archive = options.get("ready_to_archive")
             status_info = Status()
-            report_slice.last_update_time = datetime.now(pytz.utc)
-            report_slice.state = state
-            report_slice.git_commit = status_info.git_commit
             report_slice_data = {
                 "last_update_time": datetime.now(pytz.utc),
                 "state": state,
@@ -426,9 +426,9 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
             # want to do anything to the retry count bc we want to preserve as is
             if ready_to_archive:
                 report_slice_data["ready_to_archive"] = ready_to_archive
-            state_info = json.loads(report_slice.state_info)
+            state_info = orjson.loads(report_slice.state_info)
             state_info.append(state)
-            report_slice_data["state_info"] = json.dumps(state_info)
+            report_slice_data["state_info"] = orjson.dumps(state_info).decode()
             serializer = ReportSliceSerializer(instance=report_slice, data=report_slice_data, partial=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
@@ -472,7 +472,11 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
                 )
 
             LOG.info(format_message(self.prefix, "downloading %s" % report_url, account_number=self.account_number))
-            download_response = requests.get(report_url)
+            if self._http is None:
+                # one pooled client reused across downloads instead of a
+                # new connection per request
+                self._http = httpx.Client(timeout=60)
+            download_response = self._http.get(report_url)
             if download_response.status_code != HTTPStatus.OK:
                 raise RetryDownloadException(
                     format_message(
@@ -493,7 +497,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         except FailDownloadException as fail_err:
             raise fail_err
 
-        except requests.exceptions.HTTPError as err:
+        except httpx.HTTPError as err:
             raise RetryDownloadException(
                 format_message(
                     self.prefix,
@@ -551,7 +555,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
                 report_platform_id=self.report_platform_id,
             )
         )
-        metadata_json = json.loads(metadata_str)
+        metadata_json = orjson.loads(metadata_str)
         required_keys = ["report_id", "source", "report_slices"]
         missing_keys = []
         for key in required_keys:
@@ -606,7 +610,12 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
         """
         self.prefix = "EXTRACT REPORT FROM TAR"
         try:  # pylint: disable=too-many-nested-blocks
-            tar = tarfile.open(fileobj=BytesIO(report_tar_gz), mode="r:gz")
+            # decompress the whole archive once so the member reads below
+            # are plain buffer slices instead of repeated gzip inflation;
+            # the inflate is blocking CPU work, so it runs in the executor
+            # rather than on the event loop
+            extracted = await sync_to_async(gzip.decompress)(report_tar_gz)
+            tar = tarfile.open(fileobj=BytesIO(extracted), mode="r:")
             files = tar.getmembers()
             json_files = []
             metadata_file = None
@@ -621,6 +630,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
                 try:
                     valid_slice_ids, options = await self.validate_metadata_file(tar, metadata_file)
                     report_names = []
+                    slice_candidates = []
                     for report_id, _ in valid_slice_ids.items():
                         for file in json_files:
                             if report_id in file.name:
@@ -660,7 +670,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
                                         report_platform_id=self.report_platform_id,
                                     )
                                 )
-                                report_slice_json = json.loads(report_slice_string)
+                                report_slice_json = orjson.loads(report_slice_string)
                                 report_slice_id = report_slice_json.get("report_slice_id", "")
                                 if report_slice_id != report_id:
                                     matches_metadata = False
@@ -690,10 +700,19 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
                                     "source": options.get("source"),
                                     "source_metadata": options.get("source_metadata", {}),
                                 }
-                                async_rs = sync_to_async(self.create_report_slice)(slice_options)
-                                created = await async_rs
-                                if created:
-                                    report_names.append(report_id)
+                                slice_candidates.append((report_id, slice_options))
+
+                    if slice_candidates:
+                        # issue the slice creations together instead of one
+                        # awaited round trip at a time; sync_to_async runs
+                        # them on its thread-sensitive executor, so the DB
+                        # access itself stays serialized
+                        created_flags = await asyncio.gather(
+                            *(sync_to_async(self.create_report_slice)(opts) for _, opts in slice_candidates)
+                        )
+                        report_names = [
+                            report_id for (report_id, _), created in zip(slice_candidates, created_flags) if created
+                        ]
 
                     if not report_names:
                         raise FailExtractException(
@@ -732,7 +751,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
             )
         except FailExtractException as mkt_err:
             raise mkt_err
-        except tarfile.ReadError as err:
+        except (tarfile.ReadError, gzip.BadGzipFile, zlib.error, EOFError) as err:
             UPLOAD_EXTRACT_FAILS.inc()
             raise FailExtractException(
                 format_message(
@@ -776,7 +795,7 @@ class ReportProcessor(AbstractProcessor):  # pylint: disable=too-many-instance-a
             )
         try:
             validation = {"hash": file_hash, "request_id": self.report_or_slice.request_id, "validation": self.status}
-            msg = bytes(json.dumps(validation), "utf-8")
+            msg = orjson.dumps(validation)
             await self.producer.send_and_wait(VALIDATION_TOPIC, msg)
             LOG.info(
                 format_message(
@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Tests the garbage collector."""
-import asyncio
 import json
 import uuid
 from datetime import datetime
@@ -49,7 +48,7 @@ class GarbageCollectorTests(IsolatedAsyncioTestCase):
             "report_platform_id": "5f2cc1fd-ec66-4c67-be1b-171a595ce319",
         }
         self.archive_report = ReportArchive(
-            upload_srv_kafka_msg=json.dumps({}),
+            upload_srv_kafka_msg={},
             account="1234",
             state=Report.NEW,
             state_info=json.dumps([Report.NEW]),
@@ -103,7 +102,7 @@ class GarbageCollectorTests(IsolatedAsyncioTestCase):
         current_time = datetime.now(pytz.utc)
         weeks_old_time = current_time - timedelta(weeks=6)
         archive_report2 = ReportArchive(
-            upload_srv_kafka_msg=json.dumps({}),
+            upload_srv_kafka_msg={},
             account="12345",
             state=Report.NEW,
             state_info=json.dumps([Report.NEW]),
@@ -138,8 +137,9 @@ class GarbageCollectorTests(IsolatedAsyncioTestCase):
         existing_report = ReportArchive.objects.get(id=self.archive_report.id)
         self.assertEqual(existing_report, self.archive_report)
 
-    async def async_test_run_method(self):
-        """Test the run method."""
+    @patch("processor.garbage_collection.GARBAGE_COLLECTION_INTERVAL", 1)
+    async def test_run_method(self):
+        """Test the async run function."""
         self.garbage_collector.should_run = True
 
         def run_side_effect():
@@ -152,12 +152,3 @@ class GarbageCollectorTests(IsolatedAsyncioTestCase):
             "processor.garbage_collection." "GarbageCollector.remove_outdated_archives", side_effect=run_side_effect
         ):
             await self.garbage_collector.run()
-
-    @patch("processor.garbage_collection.GARBAGE_COLLECTION_INTERVAL", 1)
-    def test_run_method(self):
-        """Test the async run function."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.async_test_run_method)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
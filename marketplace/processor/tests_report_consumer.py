@@ -15,16 +15,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Tests kafka message handler."""
-import asyncio
 import io
 import json
 import tarfile
 from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import orjson
 from asgiref.sync import sync_to_async
-from asynctest import CoroutineMock
 from django import db
 
 import processor.report_consumer as msg_handler
@@ -32,40 +32,59 @@ from api.models import Report
 
 # from django.test import TestCase
 
+# one commit mock shared by the tests; each test resets it instead of
+# constructing a fresh mock object
+_COMMIT_MOCK = AsyncMock()
 
-def create_tar_buffer(files_data, encoding="utf-8", meta_encoding="utf-8"):
+
+def _encode_json(file_content, encoding):
+    """Encode a json payload, via orjson when the target is utf-8."""
+    if encoding == "utf-8":
+        # orjson emits utf-8 bytes directly, skipping the str hop
+        return orjson.dumps(file_content)
+    return json.dumps(file_content).encode(encoding)
+
+
+def create_tar_buffer(files_data, encoding="utf-8", meta_encoding="utf-8", compresslevel=1, compress=True):
     """Generate a file buffer based off a dictionary."""
     if not isinstance(files_data, (dict,)):
         return None
     if not all(isinstance(v, (str, dict)) for v in files_data.values()):
         return None
     tar_buffer = io.BytesIO()
-    with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar_file:
+    if compress:
+        open_kwargs = {"mode": "w:gz", "compresslevel": compresslevel}
+    else:
+        open_kwargs = {"mode": "w"}
+    with tarfile.open(fileobj=tar_buffer, **open_kwargs) as tar_file:
         for file_name, file_content in files_data.items():
             if "metadata.json" in file_name:
-                file_buffer = io.BytesIO(json.dumps(file_content).encode(meta_encoding))
+                encoded = _encode_json(file_content, meta_encoding)
             elif file_name.endswith("json"):
-                file_buffer = io.BytesIO(json.dumps(file_content).encode(encoding))
+                encoded = _encode_json(file_content, encoding)
             elif file_name.endswith("csv"):
-                file_buffer = io.BytesIO(file_content.encode(encoding))
+                encoded = file_content.encode(encoding)
             else:
                 return None
             info = tarfile.TarInfo(name=file_name)
-            info.size = len(file_buffer.getvalue())
-            tar_file.addfile(tarinfo=info, fileobj=file_buffer)
+            info.size = len(encoded)
+            tar_file.addfile(tarinfo=info, fileobj=io.BytesIO(encoded))
     tar_buffer.seek(0)
-    return tar_buffer.getvalue()
+    # getbuffer avoids copying the archive bytes out of the BytesIO
+    return tar_buffer.getbuffer()
 
 
 class KafkaMsg:  # pylint:disable=too-few-public-methods
     """Create a kafka msg."""
 
+    # only the url varies between messages, so the encoded payload is
+    # templated once at class scope instead of re-serialized per instance
+    _VALUE_TEMPLATE = b'{"url": %b, "rh_account": "1234", "request_id": "234332"}'
+
     def __init__(self, topic, url):
         """Initialize the message."""
         self._topic = topic
-        value_dict = {"url": url, "rh_account": "1234", "request_id": "234332"}
-        value_str = json.dumps(value_dict)
-        self._value = value_str.encode("utf-8")
+        self._value = self._VALUE_TEMPLATE % orjson.dumps(url)
 
     def topic(self):
         """Returns topic"""
@@ -79,14 +98,17 @@ class KafkaMsg:  # pylint:disable=too-few-public-methods
 class KafkaMsgHandlerTest(IsolatedAsyncioTestCase):
     """Test Cases for the Kafka msg handler."""
 
-    def setUp(self):
-        """Create test setup."""
-        self.payload_url = "http://insights-upload.com/q/file_to_validate"
-        self.report_consumer = msg_handler.ReportConsumer()
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared test fixtures once for the class."""
+        super().setUpClass()
+        cls.payload_url = "http://insights-upload.com/q/file_to_validate"
+        cls.mkt_msg = KafkaMsg(msg_handler.MKT_TOPIC, cls.payload_url)
+        cls.report_consumer = msg_handler.ReportConsumer()
 
     def tearDown(self):
         """Remove test setup."""
-        db.connections.close_all()
+        db.connection.close_if_unusable_or_obsolete()
 
     def test_format_message_no_account_report(self):
         """Test format message without account or report id."""
@@ -107,46 +129,84 @@ class KafkaMsgHandlerTest(IsolatedAsyncioTestCase):
         with self.assertRaises(msg_handler.MKTKafkaMsgException):
             self.report_consumer.unpack_consumer_record(fake_record)
 
-    async def save_and_ack(self):
+    async def test_save_and_ack_success(self):
         """Test the save and ack message method."""
+        _COMMIT_MOCK.reset_mock(side_effect=True)
         self.report_consumer.consumer = Mock()
-        self.report_consumer.consumer.commit = CoroutineMock()
-        mkt_msg = KafkaMsg(msg_handler.MKT_TOPIC, self.payload_url)
+        self.report_consumer.consumer.commit = _COMMIT_MOCK
+        mkt_msg = self.mkt_msg
         # test happy case
         with patch(
             "processor.report_consumer.ReportConsumer.unpack_consumer_record",
             return_value={"account": "8910", "request_id": "1234"},
         ):
             await self.report_consumer.save_message_and_ack(mkt_msg)
-            report = await sync_to_async(Report.objects.get)(account="8910")
-            self.assertEqual(json.loads(report.upload_srv_kafka_msg), {"account": "8910", "request_id": "1234"})
-            self.assertEqual(report.state, Report.NEW)
 
         # test no rh_account or request_id
         with patch("processor.report_consumer.ReportConsumer.unpack_consumer_record", return_value={"foo": "bar"}):
             await self.report_consumer.save_message_and_ack(mkt_msg)
-            with self.assertRaises(Report.DoesNotExist):
-                await sync_to_async(Report.objects.get)(upload_srv_kafka_msg=json.dumps({"foo": "bar"}))
 
         # test general exception
         def raise_error():
             """Raise a general error."""
             raise Exception("Test")
 
-        self.report_consumer.consumer.commit = CoroutineMock(side_effect=raise_error)
+        _COMMIT_MOCK.side_effect = raise_error
         with patch(
             "processor.report_consumer.ReportConsumer.unpack_consumer_record",
             return_value={"rh_account": "1112", "request_id": "1234"},
         ):
             await self.report_consumer.save_message_and_ack(mkt_msg)
-            report = await sync_to_async(Report.objects.get)(account="1112")
-            self.assertEqual(json.loads(report.upload_srv_kafka_msg), {"rh_account": "1112", "request_id": "1234"})
-            self.assertEqual(report.state, Report.NEW)
-
-    def test_save_and_ack_success(self):
-        """Test the async save and ack function."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.save_and_ack)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
+
+        def fetch_saved_reports():
+            """Fetch the saved reports with a single thread hop."""
+            account_report = Report.objects.get(account="8910")
+            missing_fields_saved = Report.objects.filter(upload_srv_kafka_msg={"foo": "bar"}).exists()
+            rh_account_report = Report.objects.get(account="1112")
+            return account_report, missing_fields_saved, rh_account_report
+
+        # a single sync_to_async hop performs all three lookups; Django 3.2
+        # does not provide the native async aget entry point
+        account_report, missing_fields_saved, rh_account_report = await sync_to_async(fetch_saved_reports)()
+        self.assertEqual(account_report.upload_srv_kafka_msg, {"account": "8910", "request_id": "1234"})
+        self.assertEqual(account_report.state, Report.NEW)
+        self.assertFalse(missing_fields_saved)
+        self.assertEqual(rh_account_report.upload_srv_kafka_msg, {"rh_account": "1112", "request_id": "1234"})
+        self.assertEqual(rh_account_report.state, Report.NEW)
+
+    async def test_save_and_ack_unit(self):
+        """Test the save and ack message method without touching the database."""
+        _COMMIT_MOCK.reset_mock(side_effect=True)
+        self.report_consumer.consumer = Mock()
+        self.report_consumer.consumer.commit = _COMMIT_MOCK
+        saved_reports = []
+        with patch.object(Report.objects, "bulk_create", side_effect=lambda objs, **_: saved_reports.extend(objs)):
+            with patch(
+                "processor.report_consumer.ReportConsumer.unpack_consumer_record",
+                return_value={"account": "8910", "request_id": "1234"},
+            ):
+                await self.report_consumer.save_message_and_ack(self.mkt_msg)
+        self.assertEqual(len(saved_reports), 1)
+        report = saved_reports[0]
+        self.assertEqual(report.upload_srv_kafka_msg, {"account": "8910", "request_id": "1234"})
+        self.assertEqual(report.state, Report.NEW)
+        self.report_consumer.consumer.commit.assert_called_once()
+
+    async def test_save_and_ack_bulk(self):
+        """Test that a batch of messages is saved with a single insert."""
+        self.report_consumer.consumer = Mock()
+        records = [KafkaMsg(msg_handler.MKT_TOPIC, self.payload_url) for _ in range(3)]
+        with patch.object(Report.objects, "bulk_create", wraps=Report.objects.bulk_create) as bulk_create:
+            await self.report_consumer.save_messages_and_ack(records)
+        bulk_create.assert_called_once()
+
+        def count_and_clean_reports():
+            """Count the saved reports and remove them."""
+            saved_reports = Report.objects.filter(account="1234")
+            saved_count = saved_reports.count()
+            saved_reports.delete()
+            return saved_count
+
+        saved_count = await sync_to_async(count_and_clean_reports)()
+        self.assertEqual(saved_count, 3)
+        self.report_consumer.consumer.commit.assert_called_once()
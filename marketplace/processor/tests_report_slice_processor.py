@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Tests the upload message report processor."""
-import asyncio
 import json
 import uuid
 from datetime import datetime
@@ -63,7 +62,7 @@ class ReportSliceProcessorTests(IsolatedAsyncioTestCase):
             "report_platform_id": "5f2cc1fd-ec66-4c67-be1b-171a595ce319",
         }
         self.report_record = Report(
-            upload_srv_kafka_msg=json.dumps(self.msg),
+            upload_srv_kafka_msg=self.msg,
             account="1234",
             state=Report.NEW,
             state_info=json.dumps([Report.NEW]),
@@ -301,32 +300,16 @@ class ReportSliceProcessorTests(IsolatedAsyncioTestCase):
         # call again for branch path where already created
         self.assertIsNotNone(processor.get_minio_client())
 
-    def test_upload_to_object_storage_none_client(self):
+    async def test_upload_to_object_storage_none_client(self):
         """Test error raised when client is not configured."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.async_test_upload_to_objectstore_none_client)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
-
-    async def async_test_upload_to_objectstore_none_client(self):
-        """Async setup for none client test."""
         report_slice_processor.MINIO_ENDPOINT = None
         report_slice_processor.MINIO_ACCESS_KEY = None
         report_slice_processor.MINIO_SECRET_KEY = None
         with self.assertRaises(report_slice_processor.RetryUploadTimeException):
             await self.processor._upload_to_object_storage()
 
-    def test_upload_to_object_storage_no_bucket(self):
+    async def test_upload_to_object_storage_no_bucket(self):
         """Test error raised when bucket does not exist."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.async_test_upload_to_objectstore_no_bucket)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
-
-    async def async_test_upload_to_objectstore_no_bucket(self):
-        """Async setup for no bucket test."""
         mock_minio = Mock()
         mock_minio.bucket_exists.return_value = False
         with patch(
@@ -335,16 +318,8 @@ class ReportSliceProcessorTests(IsolatedAsyncioTestCase):
             with self.assertRaises(report_slice_processor.RetryUploadTimeException):
                 await self.processor._upload_to_object_storage()
 
-    def test_upload_to_object_storage_upload_error(self):
+    async def test_upload_to_object_storage_upload_error(self):
         """Test error raised an upload error occurs."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.async_test_upload_to_objectstore_error)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
-
-    async def async_test_upload_to_objectstore_error(self):
-        """Async setup for upload error test."""
         mock_minio = Mock()
         mock_minio.bucket_exists.return_value = True
 
@@ -360,16 +335,8 @@ class ReportSliceProcessorTests(IsolatedAsyncioTestCase):
             with self.assertRaises(Exception):
                 await self.processor._upload_to_object_storage()
 
-    def test_upload_to_object_storage_upload_success(self):
+    async def test_upload_to_object_storage_upload_success(self):
         """Test upload success pass."""
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        coro = asyncio.coroutine(self.async_test_upload_to_objectstore)
-        event_loop.run_until_complete(coro())
-        event_loop.close()
-
-    async def async_test_upload_to_objectstore(self):
-        """Async setup for upload error test."""
         mock_minio = Mock()
         mock_minio.bucket_exists.return_value = True
         mock_minio.fput_object.return_value = True